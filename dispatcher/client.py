@@ -15,6 +15,27 @@ class WorkClient:
         if not (server_url.startswith("http://") or server_url.startswith("https://")):
             server_url = "http://" + server_url
         self.server_url = server_url.rstrip("/")
+        # Reuse one pooled connection for the repeated work/results calls
+        # instead of opening a new TCP connection per request.
+        self.session = requests.Session()
+
+    def close(self) -> None:
+        """Close the pooled connections held by this client."""
+        self.session.close()
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send on the pooled session, retrying once if the connection drops.
+
+        The server may close an idle keep-alive connection just as a request is
+        sent on it. The pool discards the dead socket, so a single retry goes out
+        on a fresh connection. Repeating a call is harmless: the server discards
+        duplicate results and releases, and work issued by a lost /work reply
+        is reissued after work_timeout.
+        """
+        try:
+            return self.session.request(method, url, **kwargs)
+        except requests.ConnectionError:
+            return self.session.request(method, url, **kwargs)
 
     def get_work(self, batch_size: int = 1) -> BatchWorkResponse:
         """
@@ -28,7 +49,7 @@ class WorkClient:
         params = {"batch_size": batch_size}
 
         try:
-            resp = requests.get(url, params=params)
+            resp = self._send("GET", url, params=params)
         except requests.ConnectionError:
             # Return a "server unavailable" response
             return BatchWorkResponse(status=WorkStatus.SERVER_UNAVAILABLE, items=[])
@@ -53,7 +74,7 @@ class WorkClient:
         submission = BatchResultSubmission(items=items)
 
         try:
-            resp = requests.post(url, json=submission.dict())
+            resp = self._send("POST", url, json=submission.dict())
         except requests.ConnectionError:
             return BatchResultResponse(status=WorkStatus.SERVER_UNAVAILABLE, count=0)
 
@@ -70,7 +91,7 @@ class WorkClient:
         body = ReleaseWorkRequest(work_ids=work_ids)
 
         try:
-            resp = requests.post(url, json=body.dict(), timeout=5)
+            resp = self._send("POST", url, json=body.dict(), timeout=5)
         except (requests.ConnectionError, requests.Timeout):
             return ReleaseWorkResponse(status=WorkStatus.SERVER_UNAVAILABLE, released_count=0)
 
@@ -63,6 +63,10 @@ class DataTracker:
     # now - work_timeout is always far greater than 0 (epoch).
     ALWAYS_EXPIRED_TIMESTAMP = 0
 
+    # Read size used when counting output lines written after the last
+    # checkpoint; keeps startup memory flat however far the checkpoint lags.
+    CHECKPOINT_SCAN_CHUNK_SIZE = 1 << 20
+
     def __init__(self, infile_path, outfile_path, checkpoint_path,
                  work_timeout=900, checkpoint_interval=60, max_retries=3):
         """
@@ -144,8 +148,13 @@ class DataTracker:
         return self._lock_stats.snapshot(now, active_hold_seconds=active_hold_seconds)
 
     def _load_checkpoint(self):
-        # If a checkpoint file exists and is non-empty, load its state.
-        if os.path.exists(self.checkpoint_path) and os.path.getsize(self.checkpoint_path) > 0:
+        # If a checkpoint file exists and is non-empty, load its state. A
+        # single stat answers both questions.
+        try:
+            checkpoint_size = os.stat(self.checkpoint_path).st_size
+        except OSError:
+            checkpoint_size = 0
+        if checkpoint_size > 0:
             try:
                 with open(self.checkpoint_path, "r") as f:
                     cp = json.load(f)
@@ -158,9 +167,19 @@ class DataTracker:
 
             # Any lines after the output_offset in in output_file have been
             # completed after the checkpoint is written, so we need to move
-            # past them in both the outfile and the infile
-            extra_lines = self.outfile.readlines()
-            extra_count = len(extra_lines)
+            # past them in both the outfile and the infile. Count newlines in
+            # fixed-size chunks rather than materializing every line; a
+            # trailing partial line still counts as one, as readlines() would.
+            extra_count = 0
+            last_chunk = b""
+            while True:
+                chunk = self.outfile.read(self.CHECKPOINT_SCAN_CHUNK_SIZE)
+                if not chunk:
+                    break
+                extra_count += chunk.count(b"\n")
+                last_chunk = chunk
+            if last_chunk and not last_chunk.endswith(b"\n"):
+                extra_count += 1
 
             # For each extra line in the output, discard one line from the input.
             for _ in range(extra_count):
@@ -181,11 +200,23 @@ class DataTracker:
         Returns True if the input file is exhausted and no pending work remains.
         """
         with self._measured_state_lock():
-            remaining = os.stat(self.infile_path).st_size - self.infile.tell()
+            # fstat the already-open handle rather than re-resolving the path.
+            remaining = os.fstat(self.infile.fileno()).st_size - self.infile.tell()
             return remaining == 0 and len(self.issued) == 0 and len(self.pending_write) == 0
 
 
     def get_work_batch(self, batch_size=1):
+        batch = self.get_work_batch_with_retry_counts(batch_size)
+        if batch:
+            return [(work_id, content) for work_id, content, _ in batch]
+        return None
+
+    def get_work_batch_with_retry_counts(self, batch_size=1):
+        """Like get_work_batch(), but yields (work_id, content, retry_count).
+
+        The retry count is captured while issuing under the same lock hold, so
+        callers do not need a second lookup that could race other requests.
+        """
         batch = []
         with self._measured_state_lock():
             now = time.time()
@@ -323,7 +354,7 @@ class DataTracker:
             self.issued[work_id] = (_content, _input_offset, retry_count, when)
 
         heapq.heappush(self.issued_heap, (when, work_id))
-        return work_id, content
+        return work_id, content, retry_count
 
 
     def _complete_work_batch(self, batch):
@@ -380,9 +411,10 @@ class DataTracker:
             _, self.input_offset, _, _ = self.issued[next_id]
             del self.issued[next_id]
 
-            output = result + "\n"
-            output = output.encode("utf-8")
-            writes.append(output)
+            # Encode the result as-is and let the final join add the newline,
+            # rather than building a temporary `result + "\n"` string per row.
+            writes.append(result.encode("utf-8"))
+            writes.append(b"\n")
 
             next_id += 1
 
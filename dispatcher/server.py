@@ -49,17 +49,16 @@ def get_work(batch_size: int = Query(1, ge=1)):
     if dt.all_work_complete():
         return BatchWorkResponse(status=WorkStatus.ALL_WORK_COMPLETE, items=[])
         
-    batch = dt.get_work_batch(batch_size)
+    batch = dt.get_work_batch_with_retry_counts(batch_size)
     if batch:
         items = []
-        for work_id, content in batch:
-            retry_count, max_retries = dt.get_retry_metadata(work_id)
+        for work_id, content, retry_count in batch:
             items.append(
                 WorkItem(
                     work_id=work_id,
                     content=content,
                     retry_count=retry_count,
-                    max_retries=max_retries,
+                    max_retries=dt.max_retries,
                 )
             )
         return BatchWorkResponse(status=WorkStatus.OK, items=items)
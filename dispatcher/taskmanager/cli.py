@@ -73,8 +73,6 @@ def _install_signal_handlers(backend: VLLMBackendManager, task_manager: TaskMana
     return work items immediately instead of waiting for work_timeout."""
 
     def _handler(signum, _):
-        import sys as _sys
-
         # Block further signals to prevent re-entry during cleanup.
         signal.signal(signal.SIGTERM, signal.SIG_IGN)
         signal.signal(signal.SIGINT, signal.SIG_IGN)
@@ -121,7 +119,7 @@ def _install_signal_handlers(backend: VLLMBackendManager, task_manager: TaskMana
                 "Error while closing backend during signal %d handling",
                 signum,
             )
-        _sys.exit(0)
+        sys.exit(0)
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         try:
@@ -200,6 +198,7 @@ def run(
 
     manager.process_tasks(source, backend)
 
+    source.close()
     backend.close()
     logger.info("All tasks completed.")
 
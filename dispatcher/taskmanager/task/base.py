@@ -167,13 +167,7 @@ class GeneratorTask(Task):
             self._result = stop.value
         except TaskFailed as e:
             # Handle a deliberate failure during initialization.
-            self._result = {
-                "__ERROR__": {
-                    "error": e.error_type,
-                    "message": e.message,
-                    "task_data": self.data
-                }
-            }
+            self._set_failed(e)
         except TaskRetry as e:
             self._set_retry(e)
 
@@ -219,6 +213,15 @@ class GeneratorTask(Task):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _set_failed(self, exc: TaskFailed) -> None:
+        self._result = {
+            "__ERROR__": {
+                "error": exc.error_type,
+                "message": exc.message,
+                "task_data": self.data
+            }
+        }
+
     def _set_retry(self, exc: TaskRetry) -> None:
         self._retry_requested = True
         self._retry_message = exc.message
@@ -260,12 +263,6 @@ class GeneratorTask(Task):
             self._result = stop.value
         except TaskFailed as e:
             # The task has deliberately failed. Set its final result to the error.
-            self._result = {
-                "__ERROR__": {
-                    "error": e.error_type,
-                    "message": e.message,
-                    "task_data": self.data
-                }
-            }
+            self._set_failed(e)
         except TaskRetry as e:
             self._set_retry(e)
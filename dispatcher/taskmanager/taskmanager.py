@@ -55,7 +55,7 @@ class TaskManager:
                     
                     # 3. Check if we're at or above the task limit for warning purposes
                     if len(self.active_tasks) >= self.max_active_tasks and not self._warned_about_task_limit:
-                        self.logger.warning(f"Exceeding suggested maximum active tasks limit ({self.max_active_tasks})")
+                        self.logger.warning("Exceeding suggested maximum active tasks limit (%d)", self.max_active_tasks)
                         self._warned_about_task_limit = True
                     
                     # 4. If workers aren't busy and we have room for more tasks, get more
@@ -71,7 +71,7 @@ class TaskManager:
                         if new_tasks:
                             # Add all new tasks (never discard any)
                             self.active_tasks.extend(new_tasks)
-                            self.logger.debug(f"Added {len(new_tasks)} new tasks. Total active: {len(self.active_tasks)}")
+                            self.logger.debug("Added %d new tasks. Total active: %d", len(new_tasks), len(self.active_tasks))
                     
                     # 5. Handle completed tasks
                     self._handle_completed_tasks(task_source)
@@ -87,7 +87,7 @@ class TaskManager:
             except KeyboardInterrupt:
                 self.logger.info("Keyboard interrupt received. Exiting...")
             except Exception as e:
-                self.logger.exception(f"Unexpected error in main loop: {e}")
+                self.logger.exception("Unexpected error in main loop: %s", e)
     
     def _process_completed_futures(self):
         """Process results from completed requests."""
@@ -103,34 +103,35 @@ class TaskManager:
                 
                 # Pass the response to the task
                 task.process_result(response)
-                self.logger.debug(f"Processed result for task")
+                self.logger.debug("Processed result for task")
                 
             except Exception as e:
                 # This shouldn't normally happen as the backend should wrap errors in a Response
-                self.logger.error(f"Unexpected error in future execution: {e}")
+                self.logger.error("Unexpected error in future execution: %s", e)
                 # Create an error response and pass it to the task
                 error_response = Response.from_error(request, e)
                 task.process_result(error_response)
     
     def _schedule_requests_from_tasks(self, executor, backend_manager):
         """Schedule requests from tasks until all workers are busy."""
-        # Keep scheduling until workers are full or no more requests are available
-        while len(self.pending_futures) < self.num_workers:
-            # Try each task in order
-            for task in self.active_tasks:
-                if task.is_done():
-                    continue
-                
+        # Task state only changes in _process_completed_futures, so a task that
+        # has no request ready now will not have one later in this pass. Walk
+        # the tasks once, draining each in order, instead of rescanning the
+        # list from the start after every submission.
+        for task in self.active_tasks:
+            if len(self.pending_futures) >= self.num_workers:
+                break
+            if task.is_done():
+                continue
+            
+            while len(self.pending_futures) < self.num_workers:
                 request = task.get_next_request()
-                if request is not None:
-                    # Submit the request to the backend
-                    future = executor.submit(backend_manager.process, request)
-                    self.pending_futures[future] = (task, request)
-                    self.logger.debug(f"Submitted request for task")
+                if request is None:
                     break
-            else:
-                # We checked all tasks and none had requests available
-                break
+                # Submit the request to the backend
+                future = executor.submit(backend_manager.process, request)
+                self.pending_futures[future] = (task, request)
+                self.logger.debug("Submitted request for task")
     
     def _handle_completed_tasks(self, task_source):
         """Save results for completed tasks and remove them."""
@@ -144,9 +145,9 @@ class TaskManager:
             try:
                 # Save the result
                 task_source.save_task_result(task)
-                self.logger.debug(f"Saved task result")
+                self.logger.debug("Saved task result")
             except Exception as e:
-                self.logger.exception(f"Error saving task result: {e}")
+                self.logger.exception("Error saving task result: %s", e)
             
             # Remove the task from active tasks
             self.active_tasks.pop(i)
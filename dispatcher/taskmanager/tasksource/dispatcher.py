@@ -29,9 +29,9 @@ class DispatcherTaskSource(TaskSource):
         # Initialize client immediately
         try:
             self.client = WorkClient(self.dispatcher_server)
-            self.logger.info(f"Initialized Dispatcher client for server {self.dispatcher_server}")
+            self.logger.info("Initialized Dispatcher client for server %s", self.dispatcher_server)
         except Exception as e:
-            self.logger.error(f"Failed to initialize Dispatcher client: {e}")
+            self.logger.error("Failed to initialize Dispatcher client: %s", e)
             self._is_exhausted = True  # Mark as exhausted so we don't keep trying
             raise
         
@@ -54,7 +54,7 @@ class DispatcherTaskSource(TaskSource):
                         try:
                             task_data = json.loads(work_item.content)
                         except json.JSONDecodeError as e:
-                            self.logger.error(f"Error parsing JSON for work item {work_item.work_id}: {e}")
+                            self.logger.error("Error parsing JSON for work item %s: %s", work_item.work_id, e)
                             # Return an error to the dispatcher
                             work_item.set_result(json.dumps({"error": f"Failed to parse JSON: {e}"}))
                             self.client.submit_results([work_item])
@@ -65,13 +65,13 @@ class DispatcherTaskSource(TaskSource):
                         tasks.append(task)
                         
                     except Exception as e:
-                        self.logger.exception(f"Error creating task for work item {work_item.work_id}: {e}")
+                        self.logger.exception("Error creating task for work item %s: %s", work_item.work_id, e)
                         # Return an error to the dispatcher
                         work_item.set_result(json.dumps({"error": f"Failed to create task: {str(e)}"}))
                         self.client.submit_results([work_item])
                 
                 if tasks:
-                    self.logger.debug(f"Created {len(tasks)} new tasks from Dispatcher")
+                    self.logger.debug("Created %d new tasks from Dispatcher", len(tasks))
                 return tasks
                 
             elif resp.status == WorkStatus.ALL_WORK_COMPLETE:
@@ -83,7 +83,7 @@ class DispatcherTaskSource(TaskSource):
             return []  # Return empty list for no new tasks
             
         except Exception as e:
-            self.logger.exception(f"Error getting work from Dispatcher: {e}")
+            self.logger.exception("Error getting work from Dispatcher: %s", e)
             return []
     
     def save_task_result(self, task: Task) -> None:
@@ -107,19 +107,25 @@ class DispatcherTaskSource(TaskSource):
                         resp.released_count,
                     )
                 else:
-                    self.logger.debug(f"Released work item {work_item.work_id} for retry: {task.retry_reason}")
+                    self.logger.debug("Released work item %s for retry: %s", work_item.work_id, task.retry_reason)
                 return
 
             work_item.set_result(json.dumps(result, ensure_ascii=False))
             
             # Submit back to the dispatcher
             self.client.submit_results([work_item])
-            self.logger.debug(f"Submitted result for work item {work_item.work_id} back to Dispatcher")
+            self.logger.debug("Submitted result for work item %s back to Dispatcher", work_item.work_id)
             
         except Exception as e:
-            self.logger.exception(f"Error saving task result: {e}")
+            self.logger.exception("Error saving task result: %s", e)
     
     @property
     def is_exhausted(self) -> bool:
         """Check if the Dispatcher has no more work available."""
         return self._is_exhausted
+
+    def close(self) -> None:
+        """Close the Dispatcher client's connections."""
+        if hasattr(self, 'client') and self.client:
+            self.client.close()
+            self.client = None
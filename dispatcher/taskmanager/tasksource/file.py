@@ -29,9 +29,9 @@ class FileTaskSource(TaskSource):
         try:
             self.input_file = open(self.input_file_path, "r", encoding="utf-8")
             self.output_file = open(self.output_file_path, "w", encoding="utf-8")
-            self.logger.info(f"Opened input file '{self.input_file_path}' and output file '{self.output_file_path}'")
+            self.logger.info("Opened input file '%s' and output file '%s'", self.input_file_path, self.output_file_path)
         except Exception as e:
-            self.logger.error(f"Error initializing FileTaskSource: {e}")
+            self.logger.error("Error initializing FileTaskSource: %s", e)
             raise
         
         self._is_exhausted = False
@@ -73,14 +73,14 @@ class FileTaskSource(TaskSource):
                 tasks.append(task)
                 
             except json.JSONDecodeError as e:
-                self.logger.error(f"Error parsing JSON from line {line_number}: {e}")
+                self.logger.error("Error parsing JSON from line %s: %s", line_number, e)
                 # Skip bad lines and continue
             except Exception as e:
-                self.logger.exception(f"Error creating task from line {line_number}: {e}")
+                self.logger.exception("Error creating task from line %s: %s", line_number, e)
                 # Skip problematic lines and continue
         
         if tasks:
-            self.logger.info(f"Created {len(tasks)} new tasks from input file")
+            self.logger.info("Created %d new tasks from input file", len(tasks))
         
         return tasks
     
@@ -91,8 +91,10 @@ class FileTaskSource(TaskSource):
                 result, context = task.get_result()
                 line_number = context.get("line_number", "unknown")
                 self.logger.warning(
-                    f"Task from line {line_number} requested retry, but FileTaskSource "
-                    f"does not support retries. Skipping. Reason: {task.retry_reason}"
+                    "Task from line %s requested retry, but FileTaskSource "
+                    "does not support retries. Skipping. Reason: %s",
+                    line_number,
+                    task.retry_reason,
                 )
                 return
 
@@ -104,10 +106,10 @@ class FileTaskSource(TaskSource):
             self.output_file.flush()
 
             line_number = context.get("line_number", "unknown")
-            self.logger.debug(f"Saved result for line {line_number} to output file")
+            self.logger.debug("Saved result for line %s to output file", line_number)
             
         except Exception as e:
-            self.logger.exception(f"Error saving task result: {e}")
+            self.logger.exception("Error saving task result: %s", e)
     
     def close(self) -> None:
         """Close files."""
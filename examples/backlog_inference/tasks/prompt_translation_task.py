@@ -55,6 +55,7 @@ LANGUAGE_NAMES = {
     "is": ["Icelandic", "isl"],
     "no": ["Norwegian", "nob"],
 }
+TARGET_LANGUAGE_NAME = LANGUAGE_NAMES.get(LANGUAGE, ["Finnish"])[0]
 
 TRANSLATION_PROMPT = """
 You are a professional translator specializing in mathematics and scientific texts. Your task is to translate the following content faithfully and accurately into {language}.
@@ -107,7 +108,7 @@ class PromptTranslationTask(GeneratorTask):
 
     @staticmethod
     def _target_language() -> str:
-        return LANGUAGE_NAMES.get(LANGUAGE, ["Finnish"])[0]
+        return TARGET_LANGUAGE_NAME
 
     @classmethod
     def _messages_for_text(cls, text: str) -> List[Dict[str, str]]:
@@ -27,7 +27,7 @@ def _env_int(name: str, default: int) -> int:
 PROMPT_TRANSLATION_MAX_TOKENS = _env_int("PROMPT_TRANSLATION_MAX_TOKENS", 8192)
 TRACE_TRANSLATION_MAX_TOKENS = _env_int("TRACE_TRANSLATION_MAX_TOKENS", 32768)
 ANSWER_TRANSLATION_MAX_TOKENS = _env_int("ANSWER_TRANSLATION_MAX_TOKENS", 8192)
-THINK_BLOCK_PATTERN = re.compile(r"^\s*<think>(?P<traces>.*?)</think>(?P<answer>.*)\s*$", re.DOTALL)
+OPEN_THINK_TAG_PATTERN = re.compile(r"^\s*<think>")
 
 LANGUAGE_NAMES = {
     "bg": ["Bulgarian", "bul"],
@@ -57,6 +57,7 @@ LANGUAGE_NAMES = {
     "is": ["Icelandic", "isl"],
     "no": ["Norwegian", "nob"],
 }
+TARGET_LANGUAGE_NAME = LANGUAGE_NAMES.get(LANGUAGE, ["Finnish"])[0]
 
 TRANSLATION_PROMPT = """
 You are a professional translator specializing in mathematics and scientific texts. Your task is to translate the following content faithfully and accurately into {language}.
@@ -140,29 +141,37 @@ class ReasoningTranslationSplitTracesTask(GeneratorTask):
 
     @staticmethod
     def _split_traces_and_answer(output: str) -> tuple[str, str] | None:
-        match = THINK_BLOCK_PATTERN.match(output)
-        if match is None:
+        # Split on the first </think> with plain string scans: linear in the
+        # length of the output, with no lazy-match backtracking on long traces.
+        output = output.lstrip()
+        if not output.startswith("<think>"):
             return None
-        return match.group("traces").strip(), match.group("answer").strip()
+        close_idx = output.find("</think>", len("<think>"))
+        if close_idx == -1:
+            return None
+        traces = output[len("<think>"):close_idx]
+        answer = output[close_idx + len("</think>"):]
+        return traces.strip(), answer.strip()
 
     @staticmethod
     def _reconstruct_traces(translated_trace_body: str, translated_answer: str) -> str:
         return f"<think>{translated_trace_body}</think>{translated_answer}"
 
-    def _check_redacted_reasoning_tag(self, translation: str, issues: list[dict]) -> bool:
+    @staticmethod
+    def _check_redacted_reasoning_tag(translation: str, issues: list[dict]) -> bool:
         """Check if translation starts with <think> tag. Appends issue to list if not. Returns True if pass."""
-        pattern = r'^\s*<think>'
-        if not re.match(pattern, translation):
+        if not OPEN_THINK_TAG_PATTERN.match(translation):
             issues.append({"type": TranslationIssueType.MISSING_OPEN_THINK_TAG, "params": {}})
             return False
         return True
 
-    def _check_think_tags_structure(self, translation: str, issues: list[dict]) -> bool:
+    @staticmethod
+    def _check_think_tags_structure(translation: str, issues: list[dict]) -> bool:
         """Check that translation has exactly one <think> and one </think> tag,
         and that there is non-whitespace content after the closing </think> tag.
         Appends issues to list for each failed check. Returns True if all pass."""
-        open_count = len(re.findall(r'<think>', translation))
-        close_count = len(re.findall(r'</think>', translation))
+        open_count = translation.count('<think>')
+        close_count = translation.count('</think>')
 
         if open_count != 1:
             issues.append({"type": TranslationIssueType.INVALID_OPEN_THINK_TAG_COUNT, "params": {}})
@@ -228,7 +237,7 @@ class ReasoningTranslationSplitTracesTask(GeneratorTask):
             {
                 "role": "user",
                 "content": TRANSLATION_PROMPT.format(
-                    language=LANGUAGE_NAMES.get(LANGUAGE, ["Finnish"])[0],
+                    language=TARGET_LANGUAGE_NAME,
                     text=prompt
                 )
             }
@@ -237,7 +246,7 @@ class ReasoningTranslationSplitTracesTask(GeneratorTask):
             {
                 "role": "user",
                 "content": TRANSLATION_PROMPT.format(
-                    language=LANGUAGE_NAMES.get(LANGUAGE, ["Finnish"])[0],
+                    language=TARGET_LANGUAGE_NAME,
                     text=trace_body
                 )
             }
@@ -246,7 +255,7 @@ class ReasoningTranslationSplitTracesTask(GeneratorTask):
             {
                 "role": "user",
                 "content": TRANSLATION_PROMPT.format(
-                    language=LANGUAGE_NAMES.get(LANGUAGE, ["Finnish"])[0],
+                    language=TARGET_LANGUAGE_NAME,
                     text=answer
                 )
             }
@@ -28,6 +28,8 @@ TRACE_TRANSLATION_MAX_TOKENS = _env_int("TRACE_TRANSLATION_MAX_TOKENS", 32768)
 THOUGHT_START_MASK = "[THOUGHT_START]"
 THOUGHT_END_MASK = "[THOUGHT_END]"
 THINK_TAG_PATTERN = re.compile(r"</?think>")
+THOUGHT_MASK_PATTERN = re.compile(f"{re.escape(THOUGHT_START_MASK)}|{re.escape(THOUGHT_END_MASK)}")
+OPEN_THINK_TAG_PATTERN = re.compile(r"^\s*<think>")
 
 LANGUAGE_NAMES = {
     "bg": ["Bulgarian", "bul"],
@@ -57,6 +59,7 @@ LANGUAGE_NAMES = {
     "is": ["Icelandic", "isl"],
     "no": ["Norwegian", "nob"],
 }
+TARGET_LANGUAGE_NAME = LANGUAGE_NAMES.get(LANGUAGE, ["Finnish"])[0]
 
 TRANSLATION_PROMPT = """
 You are a professional translator specializing in mathematics and scientific texts. Your task is to translate the following content faithfully and accurately into {language}.
@@ -116,8 +119,10 @@ class ReasoningTranslationTask(GeneratorTask):
     @staticmethod
     def _restore_think_tags(text: str) -> str:
         """Restore reasoning tags after translation."""
-        text = re.sub(re.escape(THOUGHT_START_MASK), "<think>", text)
-        return re.sub(re.escape(THOUGHT_END_MASK), "</think>", text)
+        return THOUGHT_MASK_PATTERN.sub(
+            lambda match: "</think>" if match.group(0) == THOUGHT_END_MASK else "<think>",
+            text,
+        )
 
     def _failed_result(self, *, error_type: str, message: str, **payload: Any) -> Dict[str, Any]:
         """Wrap Task.build_result so every failure call site logs uniformly."""
@@ -146,20 +151,21 @@ class ReasoningTranslationTask(GeneratorTask):
             trust_remote_code=True,
         )
 
-    def _check_redacted_reasoning_tag(self, translation: str, issues: list[dict]) -> bool:
+    @staticmethod
+    def _check_redacted_reasoning_tag(translation: str, issues: list[dict]) -> bool:
         """Check if translation starts with <think> tag. Appends issue to list if not. Returns True if pass."""
-        pattern = r'^\s*<think>'
-        if not re.match(pattern, translation):
+        if not OPEN_THINK_TAG_PATTERN.match(translation):
             issues.append({"type": TranslationIssueType.MISSING_OPEN_THINK_TAG, "params": {}})
             return False
         return True
 
-    def _check_think_tags_structure(self, translation: str, issues: list[dict]) -> bool:
+    @staticmethod
+    def _check_think_tags_structure(translation: str, issues: list[dict]) -> bool:
         """Check that translation has exactly one <think> and one </think> tag,
         and that there is non-whitespace content after the closing </think> tag.
         Appends issues to list for each failed check. Returns True if all pass."""
-        open_count = len(re.findall(r'<think>', translation))
-        close_count = len(re.findall(r'</think>', translation))
+        open_count = translation.count('<think>')
+        close_count = translation.count('</think>')
 
         if open_count != 1:
             issues.append({"type": TranslationIssueType.INVALID_OPEN_THINK_TAG_COUNT, "params": {}})
@@ -214,7 +220,7 @@ class ReasoningTranslationTask(GeneratorTask):
             {
                 "role": "user", 
                 "content": TRANSLATION_PROMPT.format(
-                    language=LANGUAGE_NAMES.get(LANGUAGE, ["Finnish"])[0], 
+                    language=TARGET_LANGUAGE_NAME, 
                     text=prompt
                 )
             }
@@ -223,7 +229,7 @@ class ReasoningTranslationTask(GeneratorTask):
             {
                 "role": "user",
                 "content": TRANSLATION_PROMPT.format(
-                    language=LANGUAGE_NAMES.get(LANGUAGE, ["Finnish"])[0],
+                    language=TARGET_LANGUAGE_NAME,
                     text=masked_traces
                 )
             }
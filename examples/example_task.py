@@ -6,6 +6,9 @@ from dispatcher.taskmanager.task import GeneratorTask, TaskFailed, TaskRetry
 
 __all__ = ["CompareTwoResponsesTask", "ValidatedResponseTask"]
 
+# Cap on how much model output is quoted in a failure message.
+MAX_ERROR_RESPONSE_CHARS = 512
+
 
 class CompareTwoResponsesTask(GeneratorTask):
     """Generate two answers, have the model judge, and return preferred vs dispreferred."""
@@ -74,8 +77,11 @@ class CompareTwoResponsesTask(GeneratorTask):
         if judge_text.startswith("A"):
             winner_is_a = True
         elif not judge_text.startswith("B"):
+            snippet = judge_text[:MAX_ERROR_RESPONSE_CHARS]
+            if len(judge_text) > MAX_ERROR_RESPONSE_CHARS:
+                snippet += "..."
             raise TaskFailed(
-                message=f"Judge model returned an unexpected response: '{judge_text}'",
+                message=f"Judge model returned an unexpected response: '{snippet}'",
                 error_type="judge_response_invalid"
             )
 
@@ -1,4 +1,3 @@
-import torch
 from transformers import AutoTokenizer
 from vllm import LLM, SamplingParams
 import json
@@ -95,9 +94,9 @@ class Generator:
 
         # Combine results back with original data
         results = []
-        for i, prompt_data in enumerate(prompt_data_batch):
+        for prompt_data, responses in zip(prompt_data_batch, all_responses, strict=True):
             result = prompt_data.copy()
-            result["responses"] = all_responses[i]
+            result["responses"] = responses
             results.append(result)
 
         return results
@@ -11,6 +11,13 @@ __all__ = ["MultiSyntJudge"]
 
 thread_local = threading.local()
 
+SCORE_CATEGORIES = ("correct_language", "avoid_boilerplate", "well_formed", "complete", "accurate")
+# One pass over the judge text picks up every category tag; the backreference
+# makes sure the closing tag matches the opening one.
+SCORE_TAG_PATTERN = re.compile(
+    r"<(" + "|".join(SCORE_CATEGORIES) + r")>([01])</\1>", re.IGNORECASE
+)
+
 def get_tokenizer() -> PreTrainedTokenizerBase:
     """Tokenizers are not thread safe.  We will keep one copy of the tokenizer
 per thread using thread local storage."""
@@ -82,17 +89,12 @@ category scores in the following format, and nothing else.
         })]
 
         judge_text = response.get_text().strip()
-        def extract_score(tag: str) -> Union[int, None]:
-            match = re.search(f"<{tag}>([01])</{tag}>", judge_text, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-
-        scores = {
-            "correct_language": extract_score("correct_language"),
-            "avoid_boilerplate": extract_score("avoid_boilerplate"),
-            "well_formed": extract_score("well_formed"),
-            "complete": extract_score("complete"),
-            "accurate": extract_score("accurate"),
-        }
+        scores: Dict[str, Union[int, None]] = dict.fromkeys(SCORE_CATEGORIES)
+        for match in SCORE_TAG_PATTERN.finditer(judge_text):
+            tag = match.group(1).lower()
+            # first occurrence of each tag wins
+            if scores[tag] is None:
+                scores[tag] = int(match.group(2))
 
         if None in scores.values():
             raise TaskFailed(f"judge failure")
@@ -77,5 +77,28 @@ class TestTaskManager(unittest.TestCase):
         self.assertEqual(len(task_source.saved_results), 2)
         self.assertTrue(task_source.is_exhausted)
 
+    def test_schedule_drains_tasks_in_order_up_to_worker_limit(self):
+        """Test that scheduling fills free workers from tasks in list order."""
+        task_manager = TaskManager(num_workers=4)
+        task_manager.active_tasks = [
+            MockTask({"id": 0, "num_requests": 1}, "context_0"),
+            MockTask({"id": 1, "num_requests": 2}, "context_1"),
+            MockTask({"id": 2, "num_requests": 3}, "context_2"),
+        ]
+        task_manager.active_tasks[0].done = True
+        executor = MagicMock()
+        executor.submit.side_effect = lambda fn, request: MagicMock()
+
+        task_manager._schedule_requests_from_tasks(executor, MockBackendManager())
+
+        scheduled = [(task.context, request.context) for task, request in task_manager.pending_futures.values()]
+        self.assertEqual(scheduled, [
+            ("context_1", "req_0"),
+            ("context_1", "req_1"),
+            ("context_2", "req_0"),
+            ("context_2", "req_1"),
+        ])
+        self.assertEqual(len(task_manager.active_tasks[2].remaining_requests), 1)
+
 if __name__ == "__main__":
     unittest.main()
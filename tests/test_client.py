@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 import responses
 import requests
 from dispatcher.client import WorkClient
@@ -165,5 +166,55 @@ class TestWorkClient(unittest.TestCase):
         self.assertEqual(resp.status, WorkStatus.SERVER_UNAVAILABLE)
         self.assertEqual(resp.count, 0)
 
+    @responses.activate
+    def test_submit_results_retries_once_on_dropped_connection(self):
+        """
+        A connection dropped by the server's keep-alive timeout is retried once
+        on a fresh connection instead of reporting SERVER_UNAVAILABLE.
+        """
+        item = WorkItem(work_id=7, content="content7", result="processed7")
+        calls = []
+        def drop_first_connection(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise requests.ConnectionError("Connection aborted.")
+            return (200, {}, '{"status": "OK", "count": 1}')
+
+        responses.add_callback(
+            responses.POST,
+            f"{self.base_url}/results",
+            callback=drop_first_connection
+        )
+
+        resp = self.client.submit_results([item])
+        self.assertEqual(resp.status, WorkStatus.OK)
+        self.assertEqual(resp.count, 1)
+        self.assertEqual(len(calls), 2)
+
+    @responses.activate
+    def test_get_work_server_unavailable_after_retry(self):
+        """
+        A persistent connection error is retried once, then reported as SERVER_UNAVAILABLE.
+        """
+        calls = []
+        def raise_connection_error(request):
+            calls.append(request)
+            raise requests.ConnectionError("Server is down")
+
+        responses.add_callback(
+            responses.GET,
+            f"{self.base_url}/work",
+            callback=raise_connection_error
+        )
+
+        resp = self.client.get_work()
+        self.assertEqual(resp.status, WorkStatus.SERVER_UNAVAILABLE)
+        self.assertEqual(len(calls), 2)
+
+    def test_close_closes_session(self):
+        with patch.object(self.client.session, "close") as mock_close:
+            self.client.close()
+        mock_close.assert_called_once()
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@ import time
 import json
 import tempfile
 import unittest
+from unittest.mock import patch
 from dispatcher.data_tracker import DataTracker, LockStats
 
 # Use short timeouts for testing.
@@ -178,6 +179,28 @@ class TestDataTracker(unittest.TestCase):
         self.assertEqual(r5[1], "row_content_5")
         dt2.close()
 
+    def test_load_from_checkpoint_counts_extra_rows_across_chunks(self):
+        """Extra output rows are counted across scan chunks, including a trailing partial line."""
+        dt1 = DataTracker(self.infile.name, self.outfile.name, self.checkpoint,
+                          work_timeout=WORK_TIMEOUT, checkpoint_interval=CHECKPOINT_INTERVAL)
+        r0, = dt1.get_work_batch()
+        dt1.complete_work_batch([(r0[0], "result_0")])
+        dt1._write_checkpoint()
+        dt1.close()
+
+        # Simulate rows flushed after the checkpoint, the last one cut short.
+        with open(self.outfile.name, "a") as f:
+            f.write("result_1\nresult_2\nresult_3_partial")
+
+        with patch.object(DataTracker, "CHECKPOINT_SCAN_CHUNK_SIZE", 4):
+            dt2 = DataTracker(self.infile.name, self.outfile.name, self.checkpoint,
+                              work_timeout=WORK_TIMEOUT, checkpoint_interval=CHECKPOINT_INTERVAL)
+        self.assertEqual(dt2.last_processed_work_id, 3)
+        self.assertEqual(dt2.next_work_id, 4)
+        r4, = dt2.get_work_batch()
+        self.assertEqual(r4[1], "row_content_4")
+        dt2.close()
+
     def test_load_from_checkpoint_with_extra_rows_unwritten(self):
         """
         Process some rows, then process additional rows after the checkpoint was written.
@@ -375,6 +398,22 @@ class TestDataTracker(unittest.TestCase):
         self.assertEqual(retry_count, 1)
         dt.close()
 
+    def test_get_work_batch_with_retry_counts(self):
+        """Issued items carry the same retry_count that get_retry_metadata reports."""
+        dt = DataTracker(self.infile.name, self.outfile.name, self.checkpoint,
+                         work_timeout=WORK_TIMEOUT, checkpoint_interval=CHECKPOINT_INTERVAL,
+                         max_retries=3)
+        (id0, _, retry0), (id1, _, retry1) = dt.get_work_batch_with_retry_counts(2)
+        self.assertEqual((retry0, retry1), (0, 0))
+        dt.release_work([id1])
+
+        (reissued_id, content, retry_count), = dt.get_work_batch_with_retry_counts()
+        self.assertEqual(reissued_id, id1)
+        self.assertEqual(content, "row_content_1")
+        self.assertEqual(retry_count, 1)
+        self.assertEqual(dt.get_retry_metadata(id1), (retry_count, 3))
+        dt.close()
+
     def test_release_completed_or_unknown_is_noop(self):
         """Releasing already-completed or unknown work_ids should be a no-op."""
         dt = DataTracker(self.infile.name, self.outfile.name, self.checkpoint,